@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script compacts the correlation coefficient files published by NIST into a single store (corrcoef.json.gz).
+
+Each NIST file lists the full N x N correlation matrix of a version, zeros included. The compact store:
+- Keeps a single table of identifiers shared by all versions
+- Only records the upper triangle of each (symmetric) matrix, without the diagonal and the zero coefficients
+- Stores the coefficients as integers scaled by the number of decimal digits used in the version
+- Records the first version in full (base) and the following ones as changes to the previous version
+
+Any version's matrix can be rebuilt from the store with get_correlation_matrix(), and the identifier names
+listed in the files are available with get_correlation_names(). The ASCII files themselves are not kept in the
+repository: they can be downloaded with fetch.py, after which this script merges them into the store.
+
+This work is licensed under the terms of the MIT license.
+For a copy, see <https://opensource.org/licenses/MIT>.
+
+"""
+
+import argparse
+from functools import cache
+import gzip
+import json
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+STORE_FILENAME = 'corrcoef.json.gz'
+
+script_dir = os.path.dirname(__file__)
+
+
+@cache
+def get_corrcoeff(year):
+    """
+    Returns the correlation coefficient ASCII file for the given year if it exists.
+    """
+    corrceoff_filepath = os.path.join(script_dir, str(year), f'corrcoef{year}.txt')
+    if os.path.isfile(corrceoff_filepath):
+        with open(corrceoff_filepath, 'r') as f:
+            lines = f.readlines()
+            return lines
+    else:
+        return None
+
+
+def read_corrcoef_names(year: int) -> Dict[str, str]:
+    """
+    Extract a dictionary of id/name pairs from the correlation coefficient ASCII file.
+    
+    Lines documenting the names and ids have contain '---'
+    
+    """
+    data = {}
+    for line in get_corrcoeff(year) or []:
+        if "---" in line:
+            # parse this line and extract name / id
+            pattern = r'(\S+)\s*---\s*(.+)' 
+            m = re.search(pattern, line)
+            if m:
+                id = m.group(1)
+                name = m.group(2).strip()
+                # add to dictionary
+                data[id] = name
+    return data
+
+
+def read_corrcoef_file(year: int) -> Tuple[List[str], Dict[Tuple[str, str], float], int]:
+    """
+    Parses the NIST correlation coefficient ASCII file of the given year.
+
+    Returns the identifiers in order of appearance, the non-zero coefficients of the upper triangle,
+    and the number of decimal digits of the coefficients.
+    """
+    ids = []
+    ids_index = {}
+    coefficients = {}
+    digits = 0
+    for line in get_corrcoeff(year) or []:
+        if '---' in line:
+            continue
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        id1, id2, value = parts
+        try:
+            numeric_value = float(value)
+        except ValueError:
+            continue
+        for id in (id1, id2):
+            if id not in ids_index:
+                ids_index[id] = len(ids)
+                ids.append(id)
+        digits = max(digits, len(value.split('.')[1]) if '.' in value else 0)
+        # the matrix is symmetric with a unit diagonal: only keep the non-zero upper triangle
+        if numeric_value != 0 and ids_index[id1] < ids_index[id2]:
+            coefficients[(id1, id2)] = numeric_value
+    return ids, coefficients, digits
+
+
+def get_store_years() -> List[int]:
+    """
+    Returns the years found in the store or with a correlation coefficient ASCII file.
+    """
+    years = set()
+    if os.path.isfile(os.path.join(script_dir, STORE_FILENAME)):
+        years.update(int(year) for year in get_store()['releases'])
+    for name in os.listdir(script_dir):
+        if name.isdigit() and os.path.isfile(os.path.join(script_dir, name, f'corrcoef{name}.txt')):
+            years.add(int(name))
+    return sorted(years)
+
+
+def corrcoef_to_store():
+    """
+    Produces the compact store for all the years.
+
+    Years with a correlation coefficient ASCII file are read from it, the others are taken from the existing store.
+    """
+    ids = []
+    ids_index = {}
+    releases = {}
+    previous = {}
+    base = None
+    for year in get_store_years():
+        if get_corrcoeff(year):
+            year_ids, coefficients, digits = read_corrcoef_file(year)
+            names = read_corrcoef_names(year)
+        else:
+            release = get_store()['releases'][str(year)]
+            year_ids = get_correlation_ids(year)
+            coefficients = get_coefficients(year)
+            digits = release['digits']
+            names = release['names']
+        if not year_ids:
+            logging.warning(f"No correlation coefficients found for {year}")
+            continue
+        for id in year_ids:
+            if id not in ids_index:
+                ids_index[id] = len(ids)
+                ids.append(id)
+        # pairs are keyed on the global identifier index, lowest first
+        scale = 10 ** digits
+        current = {}
+        for (id1, id2), value in coefficients.items():
+            i, j = sorted((ids_index[id1], ids_index[id2]))
+            current[(i, j)] = round(value * scale) / scale
+        changed = []
+        for (i, j), value in sorted(current.items()):
+            if previous.get((i, j)) != value:
+                changed.extend([i, j, round(value * scale)])
+        removed = []
+        for (i, j) in sorted(previous.keys() - current.keys()):
+            removed.extend([i, j])
+        releases[str(year)] = {
+            'base': base,
+            'digits': digits,
+            'ids': [ids_index[id] for id in year_ids],
+            'names': names,
+            'set': changed,
+            'unset': removed,
+        }
+        logging.info(f"{year}: {len(current)} coefficients, {len(changed)//3} changed, {len(removed)//2} removed")
+        previous = current
+        base = str(year)
+    store = {'ids': ids, 'releases': releases}
+    filepath = os.path.join(script_dir, STORE_FILENAME)
+    # fixed gzip timestamp so that the file only changes with its content
+    with gzip.GzipFile(filepath, 'wb', mtime=0) as f:
+        f.write(json.dumps(store, separators=(',', ':')).encode('utf-8'))
+    for function in (get_store, get_coefficients, get_correlation_index):
+        function.cache_clear()
+    logging.info(f"Correlation coefficients have been saved to {filepath}")
+
+
+@cache
+def get_store() -> dict:
+    """
+    Loads and returns the compact correlation coefficient store.
+    """
+    filepath = os.path.join(script_dir, STORE_FILENAME)
+    with gzip.open(filepath, 'rt') as f:
+        return json.load(f)
+
+
+@cache
+def get_coefficients(year: int) -> Dict[Tuple[str, str], float]:
+    """
+    Returns the non-zero, off-diagonal coefficients of the given year keyed on the (id1, id2) pair.
+
+    Each pair is present once, in the store order. Use get_correlation() for symmetric lookups.
+    """
+    release = get_store()['releases'].get(str(year))
+    if release is None:
+        return {}
+    ids = get_store()['ids']
+    coefficients = dict(get_coefficients(int(release['base']))) if release['base'] else {}
+    removed = release['unset']
+    for k in range(0, len(removed), 2):
+        del coefficients[(ids[removed[k]], ids[removed[k+1]])]
+    changed = release['set']
+    scale = 10 ** release['digits']
+    for k in range(0, len(changed), 3):
+        coefficients[(ids[changed[k]], ids[changed[k+1]])] = changed[k+2] / scale
+    return coefficients
+
+
+def get_correlation_names(year: int) -> Dict[str, str]:
+    """
+    Returns the id/name pairs listed in the correlation coefficient file of the given year.
+    """
+    release = get_store()['releases'].get(str(year))
+    return dict(release['names']) if release else {}
+
+
+def get_correlation_ids(year: int) -> List[str]:
+    """
+    Returns the identifiers of the quantities with correlation coefficients in the given year.
+    """
+    release = get_store()['releases'].get(str(year))
+    if release is None:
+        return []
+    ids = get_store()['ids']
+    return [ids[i] for i in release['ids']]
+
+
+@cache
+def get_correlation_index(year: int) -> Dict[str, int]:
+    """
+    Returns the position of each identifier in the correlation matrix of the given year.
+    """
+    return {id: i for i, id in enumerate(get_correlation_ids(year))}
+
+
+def get_correlation(year: int, id1: str, id2: str) -> Optional[float]:
+    """
+    Returns the correlation coefficient between two quantities, or None if not available for the given year.
+    """
+    index = get_correlation_index(year)
+    if id1 not in index or id2 not in index:
+        return None
+    if id1 == id2:
+        return 1.0
+    coefficients = get_coefficients(year)
+    return coefficients.get((id1, id2), coefficients.get((id2, id1), 0.0))
+
+
+def get_correlation_matrix(year: int) -> Tuple[List[str], List[List[float]]]:
+    """
+    Rebuilds the full correlation matrix of the given year.
+
+    Returns the identifiers and the matrix rows, in the same order.
+    """
+    ids = get_correlation_ids(year)
+    index = get_correlation_index(year)
+    matrix = [[0.0] * len(ids) for _ in ids]
+    for i in range(len(ids)):
+        matrix[i][i] = 1.0
+    for (id1, id2), value in get_coefficients(year).items():
+        i, j = index[id1], index[id2]
+        matrix[i][j] = value
+        matrix[j][i] = value
+    return ids, matrix
+
+
+def main():
+    corrcoef_to_store()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Compact the NIST correlation coefficient files into a single store.')
+    parser.add_argument('-ll','--loglevel', help="Python logging level", default="INFO")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s')
+    if args.loglevel:
+        logging.getLogger().setLevel(args.loglevel.upper())
+
+    main()
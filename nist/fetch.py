@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script fetches the files published by NIST for a release of the fundamental physical constants.
+
+For each requested version, it:
+- Downloads the release artifacts (allascii, corrcoef) concurrently with a bounded pool of workers
+- Resumes interrupted downloads using HTTP range requests on the partial (.part) files
+- Verifies the SHA-256 checksum recorded in checksums.json (when known)
+- Atomically moves the verified files into the version sub-directory
+- Hands off to repackage.py to produce the JSON and CSV versions of the allascii file
+
+The NIST ASCII archive serves the files without their .txt extension (e.g. ArchiveASCII/corrcoef2018).
+The PDF documents are not hosted there: they are only fetched with --documents, from a mirror holding all
+the files of a release (--base-url), such as a local mock HTTP server.
+
+This work is licensed under the terms of the MIT license.
+For a copy, see <https://opensource.org/licenses/MIT>.
+
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import corrcoef
+import repackage
+
+DEFAULT_BASE_URL = "https://pml.nist.gov/cuu/Constants/ArchiveASCII"
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 60
+CHUNK_SIZE = 64 * 1024
+
+script_dir = os.path.dirname(__file__)
+
+
+class ChecksumError(Exception):
+    """
+    Raised when a downloaded artifact does not match its recorded checksum
+    """
+
+
+@cache
+def get_checksums():
+    """
+    Loads and returns the known artifact checksums from the JSON file.
+    """
+    filepath = os.path.join(script_dir, 'checksums.json')
+    if os.path.isfile(filepath):
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def file_sha256(filepath: str) -> str:
+    """
+    Returns the SHA-256 hex digest of the given file.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def checksums_to_json():
+    """
+    Produces a json file with the SHA-256 checksums of the NIST artifacts found in the version sub-directories.
+
+    Files generated by repackage.py (allascii CSV/JSON) are not NIST artifacts and are excluded.
+    Known artifacts that are not available locally (e.g. the correlation coefficient files) are kept.
+    """
+    data = {year: dict(artifacts) for year, artifacts in get_checksums().items()}
+    for year in sorted(os.listdir(script_dir)):
+        year_dir = os.path.join(script_dir, year)
+        if not (year.isdigit() and os.path.isdir(year_dir)):
+            continue
+        year_data = data.setdefault(year, {})
+        for filename in sorted(os.listdir(year_dir)):
+            if filename.startswith('allascii_') and not filename.endswith('.txt'):
+                continue
+            if filename.endswith('.part'):
+                continue
+            year_data[filename] = file_sha256(os.path.join(year_dir, filename))
+        data[year] = dict(sorted(year_data.items()))
+    data = dict(sorted(data.items()))
+    with open(os.path.join(script_dir, 'checksums.json'), 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def release_artifacts(year: int, documents: bool = False) -> List[str]:
+    """
+    Returns the artifact filenames published for the given year.
+
+    These are the ASCII entries of checksums.json (all entries if documents is set),
+    or the allascii file for an unknown release.
+    """
+    artifacts = get_checksums().get(str(year))
+    if not artifacts:
+        return [f'allascii_{year}.txt']
+    return [filename for filename in artifacts if documents or filename.endswith('.txt')]
+
+
+def artifact_url(base_url: str, filename: str) -> str:
+    """
+    Returns the URL of an artifact. The ASCII files are served without their .txt extension.
+    """
+    remote_filename = filename[:-len('.txt')] if filename.endswith('.txt') else filename
+    return f"{base_url.rstrip('/')}/{remote_filename}"
+
+
+def download(url: str, part_filepath: str, timeout: float):
+    """
+    Downloads the content of the URL into the .part file, resuming from its current size if it exists.
+    """
+    offset = os.path.getsize(part_filepath) if os.path.isfile(part_filepath) else 0
+    request = Request(url)
+    if offset:
+        request.add_header('Range', f'bytes={offset}-')
+        logging.info(f"Resuming {url} at byte {offset}")
+    else:
+        logging.info(f"Downloading {url}")
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            # the server may ignore the range and send the whole content
+            mode = 'ab' if offset and response.status == 206 else 'wb'
+            with open(part_filepath, mode) as f:
+                for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                    f.write(chunk)
+    except HTTPError as e:
+        # 416: the partial file already holds the whole content
+        if not (offset and e.code == 416):
+            raise
+
+
+def fetch_artifact(base_url: str, year: int, filename: str, expected_sha256: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT) -> str:
+    """
+    Downloads an artifact into the version sub-directory and returns its path.
+
+    The content is written to a .part file first. An existing .part file is resumed using a range request.
+    If the checksum (when known) does not match, the download is retried once from scratch, as the resumed
+    .part file may have been stale. The file is moved into place only once the checksum has been verified.
+    """
+    year_dir = os.path.join(script_dir, str(year))
+    os.makedirs(year_dir, exist_ok=True)
+    filepath = os.path.join(year_dir, filename)
+    part_filepath = filepath + '.part'
+
+    # skip files that are already in place
+    if os.path.isfile(filepath) and (expected_sha256 is None or file_sha256(filepath) == expected_sha256):
+        logging.info(f"{filename} is up to date")
+        return filepath
+
+    url = artifact_url(base_url, filename)
+    download(url, part_filepath, timeout)
+    if expected_sha256 is not None:
+        sha256 = file_sha256(part_filepath)
+        if sha256 != expected_sha256:
+            logging.warning(f"Checksum mismatch for {url}, downloading again")
+            os.remove(part_filepath)
+            download(url, part_filepath, timeout)
+            sha256 = file_sha256(part_filepath)
+            if sha256 != expected_sha256:
+                os.remove(part_filepath)
+                raise ChecksumError(f"Checksum mismatch for {url}: expected {expected_sha256}, got {sha256}")
+    else:
+        logging.warning(f"No checksum known for {filename}, skipping verification")
+    os.replace(part_filepath, filepath)
+    logging.info(f"{filename} has been saved to {filepath}")
+    return filepath
+
+
+def fetch_release(year: int, base_url: str = DEFAULT_BASE_URL, workers: int = DEFAULT_WORKERS,
+                  documents: bool = False, timeout: float = DEFAULT_TIMEOUT) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+    """
+    Downloads all artifacts of the given year concurrently.
+
+    Returns the paths of the fetched artifacts and the errors of the failed ones, both keyed on the filename.
+    """
+    checksums = get_checksums().get(str(year), {})
+    filepaths = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            filename: executor.submit(fetch_artifact, base_url, year, filename, checksums.get(filename), timeout)
+            for filename in release_artifacts(year, documents)
+        }
+        for filename, future in futures.items():
+            try:
+                filepaths[filename] = future.result()
+            except Exception as e:
+                logging.error(f"Failed to fetch {filename}: {e}")
+                errors[filename] = e
+    return filepaths, errors
+
+
+def main():
+    if args.checksums:
+        checksums_to_json()
+        logging.info("Checksums have been saved to checksums.json")
+        return 0
+
+    years = args.year or repackage.ALL_VERSIONS
+    failed = False
+    for year in years:
+        logging.info("="*80)
+        logging.info(f"Fetching {year} release")
+        filepaths, errors = fetch_release(year, args.base_url, args.workers, args.documents, args.timeout)
+        failed = failed or bool(errors)
+        if f'corrcoef{year}.txt' in filepaths:
+            # the correlation coefficients are kept in the compact store
+            corrcoef.corrcoef_to_store()
+        if not args.noprocess and f'allascii_{year}.txt' in filepaths:
+            repackage.process_year(year)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Fetch physical constants files published by NIST.')
+    parser.add_argument('year', nargs='*', type=int, help='The year(s) to fetch')
+    parser.add_argument('-u', '--base-url', help="Base URL of the published files", default=DEFAULT_BASE_URL)
+    parser.add_argument('-w', '--workers', type=int, help="Maximum number of concurrent downloads", default=DEFAULT_WORKERS)
+    parser.add_argument('-t', '--timeout', type=float, help="Timeout in seconds of the server connection and reads", default=DEFAULT_TIMEOUT)
+    parser.add_argument('-d', '--documents', action="store_true", help="Also fetch the PDF documents (requires a mirror holding them)")
+    parser.add_argument('-np', '--noprocess', action="store_true", help="Skip processing the allascii file after download")
+    parser.add_argument('-cs', '--checksums', action="store_true", help="Regenerate checksums.json from the local files and exit")
+    parser.add_argument('-ll','--loglevel', help="Python logging level", default="INFO")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(threadName)s %(message)s')
+    if args.loglevel:
+        logging.getLogger().setLevel(args.loglevel.upper())
+
+    sys.exit(main())
@@ -19,7 +19,7 @@ For a copy, see <https://opensource.org/licenses/MIT>.
 """
 
 import csv
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from functools import cache
 import logging
 import re
@@ -27,9 +27,21 @@ from typing import List, Optional
 import json
 import argparse
 import os
+import sys
+
+import corrcoef
+
+# The canonical numeric layer is shared with the utils scripts (the repository is not a package), so that the
+# NIST and the CODATA outputs format the numbers with the same code.
+utils_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'utils')
+if utils_dir not in sys.path:
+    sys.path.append(utils_dir)
+from numeric import ExactDecimal, parse_decimal  # noqa: E402
 
 ALL_VERSIONS = [1998,2002,2006,2010,2014,2018,2022]
 
+script_dir = os.path.dirname(__file__)
+
 @dataclass
 class PhysicalConstant:
     """
@@ -50,6 +62,9 @@ class PhysicalConstant:
     str_uncertainty: Optional[str] = field(init=False, default=None)
     numeric_value: Optional[float] = field(init=False, default=None)
     numeric_uncertainty: Optional[float] = field(init=False, default=None)
+    # Canonical numbers (not serialized)
+    decimal_value: Optional[ExactDecimal] = field(init=False, default=None, repr=False)
+    decimal_uncertainty: Optional[ExactDecimal] = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
         # truncated flag
@@ -107,11 +122,14 @@ class PhysicalConstant:
         else:
             pass
         # initializes computed properties
-        self.str_value = self.nist_value.replace(' ', '').replace('...', '')
-        self.numeric_value = float(self.str_value)
+        # the numbers are parsed once into their canonical (interned) decimal form
+        self.decimal_value = parse_decimal(self.nist_value)
+        self.str_value = str(self.decimal_value)
+        self.numeric_value = self.decimal_value.value
         if not self.is_exact:
-            self.str_uncertainty = self.nist_uncertainty.replace(' ', '')
-            self.numeric_uncertainty = float(self.str_uncertainty)
+            self.decimal_uncertainty = parse_decimal(self.nist_uncertainty)
+            self.str_uncertainty = str(self.decimal_uncertainty)
+            self.numeric_uncertainty = self.decimal_uncertainty.value
         
 
 class PhysicalConstantEncoder(json.JSONEncoder):
@@ -120,44 +138,19 @@ class PhysicalConstantEncoder(json.JSONEncoder):
     """
     def default(self, obj):
         if isinstance(obj, PhysicalConstant):
-            result = asdict(obj)
+            # the canonical numbers are already written as str_* and numeric_* values
+            result = {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith('decimal_')}
             return result
         return super().default(obj)
 
-@cache
-def get_corrcoeff(year):
-    """
-    Returns the correlation coefficient ASCII file for the given year if it exists.
-    """
-    corrceoff_filepath = os.path.join(script_dir, str(year), f'corrcoef{year}.txt')
-    if os.path.isfile(corrceoff_filepath):
-        with open(corrceoff_filepath, 'r') as f:
-            lines = f.readlines()
-            return lines
-    else:
-        return None
-
-@cache
 def get_corrcoeff_id_name(year):
     """
-    Extract a dictionary of id/name pairs from the correlation coefficient ASCII file.
+    Returns a dictionary of id/name pairs listed in the correlation coefficient ASCII file.
     
-    Lines documenting the names and ids have contain '---'
+    These are read from the compact correlation coefficient store (see corrcoef.py).
     
     """
-    data = {}
-    if get_corrcoeff(year):
-        for line in get_corrcoeff(year):
-            if "---" in line:
-                # parse this line and extract name / id
-                pattern = r'(\S+)\s*---\s*(.+)' 
-                m = re.search(pattern, line)
-                if m:
-                    id = m.group(1)
-                    name = m.group(2).strip()
-                    # add to dictionary
-                    data[id] = name
-    return data
+    return corrcoef.get_correlation_names(year)
 
 
 @cache
@@ -312,6 +305,35 @@ def allascii_to_json(constants: List[PhysicalConstant], filename: str):
     with open(filename, 'w') as f:
         json.dump(constants, f, cls=PhysicalConstantEncoder, indent=2)
 
+def process_year(year: int):
+    """
+    Converts the allascii file of the given year into the JSON and CSV versions.
+    """
+    input_filename = f'allascii_{year}.txt'
+    input_file = os.path.join(script_dir, str(year), input_filename)
+    logging.info("="*80)
+    logging.info(f"Processing {input_file}")
+
+    constants = read_allascii_file(input_file, year)
+    
+    # lookup and add NIST identifier to constants
+    for constant in constants:
+        constant.nist_id = lookup_id(constant.quantity)
+        if not constant.nist_id:
+            logging.warning(f"NIST identifier not found for '{constant.quantity}'")      
+
+    # Save to JSON
+    json_output_filename = f'{os.path.splitext(input_filename)[0]}.json'
+    json_output_file = os.path.join(script_dir, str(year), json_output_filename)
+    allascii_to_json(constants, json_output_file)
+    logging.info(f"JSON Data has been saved to {json_output_file}")
+
+    # Save to CSV
+    csv_output_filename = f'{os.path.splitext(input_filename)[0]}.csv'
+    csv_output_file = os.path.join(script_dir, str(year), csv_output_filename)
+    allascii_to_csv(constants, csv_output_file)
+    logging.info(f"CSV Data has been saved to {csv_output_file}")
+
 def main():
     # Generate master NIST id lookup file
     ids_to_json()
@@ -325,34 +347,9 @@ def main():
         # for specific years
         years = args.year
     for year in years:
-        input_filename = f'allascii_{year}.txt'
-        input_file = os.path.join(script_dir, str(year), input_filename)
-        logging.info("="*80)
-        logging.info(f"Processing {input_file}")
-
-        constants = read_allascii_file(input_file, year)
-        
-        # lookup and add NIST identifier to constants
-        for constant in constants:
-            constant.nist_id = lookup_id(constant.quantity)
-            if not constant.nist_id:
-                logging.warning(f"NIST identifier not found for '{constant.quantity}'")      
-
-        # Save to JSON
-        json_output_filename = f'{os.path.splitext(input_filename)[0]}.json'
-        json_output_file = os.path.join(script_dir, str(year), json_output_filename)
-        allascii_to_json(constants, json_output_file)
-        logging.info(f"JSON Data has been saved to {json_output_file}")
-
-        # Save to CSV
-        csv_output_filename = f'{os.path.splitext(input_filename)[0]}.csv'
-        csv_output_file = os.path.join(script_dir, str(year), csv_output_filename)
-        allascii_to_csv(constants, csv_output_file)
-        logging.info(f"CSV Data has been saved to {csv_output_file}")
+        process_year(year)
 
 if __name__ == "__main__":
-    script_dir = os.path.dirname(__file__)
-
     parser = argparse.ArgumentParser(description='Process physical constants from a text file and save to JSON.')
     parser.add_argument('year', nargs='*', type=int, help='The year(s) to process')
     parser.add_argument('-ll','--loglevel', help="Python logging level", default="INFO")
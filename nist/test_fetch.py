@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests fetch.py against a local mock HTTP server.
+
+The mock server serves in-memory files, honours (or ignores) range requests, and can corrupt its content
+to exercise the resume, fallback and checksum verification paths.
+
+Run with: python -m unittest test_fetch (or pytest) from the nist directory.
+"""
+
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import re
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import fetch
+
+
+class MockNistHandler(BaseHTTPRequestHandler):
+    """
+    Serves server.files (path -> bytes). Range requests are honoured unless server.ignore_range is set.
+    """
+    def do_GET(self):
+        content = self.server.files.get(self.path)
+        self.server.requests.append((self.path, self.headers.get('Range')))
+        if content is None:
+            self.send_error(404)
+            return
+        status = 200
+        m = re.match(r'bytes=(\d+)-', self.headers.get('Range') or '')
+        if m and not self.server.ignore_range:
+            start = int(m.group(1))
+            if start >= len(content):
+                self.send_error(416)
+                return
+            status = 206
+            content = content[start:]
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockNistServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), MockNistHandler)
+        self.files = {}
+        self.requests = []
+        self.ignore_range = False
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FetchTest(unittest.TestCase):
+    CONTENT = b"correlation coefficients\n" * 1000
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockNistServer()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.files = {'/corrcoef2018': self.CONTENT}
+        self.server.requests = []
+        self.server.ignore_range = False
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(fetch, 'script_dir', tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.filepath = os.path.join(tmp.name, '2018', 'corrcoef2018.txt')
+        self.part_filepath = self.filepath + '.part'
+        self.sha256 = hashlib.sha256(self.CONTENT).hexdigest()
+
+    def fetch(self):
+        return fetch.fetch_artifact(self.server.base_url, 2018, 'corrcoef2018.txt', self.sha256, timeout=5)
+
+    def write_part(self, content):
+        os.makedirs(os.path.dirname(self.part_filepath), exist_ok=True)
+        with open(self.part_filepath, 'wb') as f:
+            f.write(content)
+
+    def assertFetched(self):
+        with open(self.filepath, 'rb') as f:
+            self.assertEqual(f.read(), self.CONTENT)
+        self.assertFalse(os.path.exists(self.part_filepath))
+
+    def test_fresh_download(self):
+        self.assertEqual(self.fetch(), self.filepath)
+        self.assertFetched()
+        self.assertEqual(self.server.requests, [('/corrcoef2018', None)])
+
+    def test_resume_206(self):
+        self.write_part(self.CONTENT[:5000])
+        self.fetch()
+        self.assertFetched()
+        self.assertEqual(self.server.requests, [('/corrcoef2018', 'bytes=5000-')])
+
+    def test_resume_200_fallback(self):
+        self.server.ignore_range = True
+        self.write_part(self.CONTENT[:5000])
+        self.fetch()
+        self.assertFetched()
+
+    def test_complete_part_416(self):
+        self.write_part(self.CONTENT)
+        self.fetch()
+        self.assertFetched()
+        self.assertEqual(self.server.requests, [('/corrcoef2018', f'bytes={len(self.CONTENT)}-')])
+
+    def test_stale_part_is_downloaded_again(self):
+        # the server answers 416 and the stale .part content does not match the checksum
+        self.write_part(b"x" * len(self.CONTENT))
+        self.fetch()
+        self.assertFetched()
+        self.assertEqual(self.server.requests[-1], ('/corrcoef2018', None))
+
+    def test_checksum_mismatch(self):
+        self.server.files['/corrcoef2018'] = b"corrupted"
+        with self.assertRaises(fetch.ChecksumError):
+            self.fetch()
+        self.assertFalse(os.path.exists(self.filepath))
+        self.assertFalse(os.path.exists(self.part_filepath))
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_release_failures_are_collected(self):
+        checksums = {'2018': {'allascii_2018.txt': None, 'corrcoef2018.txt': self.sha256}}
+        self.server.files['/allascii_2018'] = b"allascii"
+        del self.server.files['/corrcoef2018']
+        with mock.patch.object(fetch, 'get_checksums', return_value=checksums):
+            filepaths, errors = fetch.fetch_release(2018, self.server.base_url, timeout=5)
+        self.assertEqual(list(filepaths), ['allascii_2018.txt'])
+        self.assertEqual(list(errors), ['corrcoef2018.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,13 @@ The sheets holding the constant data values across versions are populated from t
 """
 import argparse
 import json
-import openpyxl
 import logging
 import re
-import requests
+
+from numeric import ExactDecimalEncoder, to_decimal
 
 def download_gsheet(sheet_id, outfile):
+    import requests # imported here as only needed when refreshing the spreadsheet
     url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=xlsx"
     logging.info(f"Downloading from {url}")
     response = requests.get(url)
@@ -39,7 +40,7 @@ def get_sheet_column_map(sheet, matches):
 
 def get_row_cell_value(row, map, column_name):
     index = map[column_name].get('index')
-    if index is not None:
+    if index is not None and index < len(row): # read-only rows stop at their last non-empty cell
         return row[index].value
 
 def get_sheet_entries(sheet, columns):
@@ -59,8 +60,9 @@ def get_sheet_entries(sheet, columns):
 
 def parse_workbook(filename):
     """Parses Excel file and populates the constants model"""
+    import openpyxl # imported here as only needed when parsing the spreadsheet
     logging.debug(f"workbook={filename}")
-    wb = openpyxl.load_workbook(filename, data_only=True)
+    wb = openpyxl.load_workbook(filename, data_only=True, read_only=True) # read-only mode streams the rows
 
     output:dict = {
         "version":"0.1.0"
@@ -191,17 +193,24 @@ def parse_workbook(filename):
                 constant_version['ids'] = constant_value_ids
                 constant_version['version'] = version_id
                 constant_version['name'] = entry.get('name')
-                constant_version['value'] = entry.get('value_str')
+                # the values are kept in their canonical decimal form (written as clean strings)
                 uncertainty_str = entry.get('uncertainty_str')
                 if uncertainty_str == '(exact)':
                     uncertainty_str = None
-                constant_version['uncertainty'] = uncertainty_str
+                for (key, value_str) in (('value', entry.get('value_str')), ('uncertainty', uncertainty_str)):
+                    try:
+                        constant_version[key] = to_decimal(value_str)
+                    except ValueError:
+                        # keep the cell content as it is, as for any unparsed cell
+                        logging.error(f"Invalid {key} '{value_str}' for {constant_id} ({id}) in version {version_id}")
+                        constant_version[key] = value_str
                 if entry.get('exponent'):
                     constant_version['exponent'] = entry.get('exponent')
                 if entry.get('units'):
                     constant_version['units'] = entry.get('units')
                 constant_version['is_exact'] = entry.get('is_exact',False)
                 constant_version['is_truncated'] = entry.get('is_truncated',False)
+    wb.close() # read-only workbooks keep the file open
     return output
 
 def main():
@@ -210,7 +219,7 @@ def main():
         download_gsheet("1m5Hm3uRsgDVXIarp7-AQqt2mYSvdk0Bvzgx3bvdMT6s", sheet_filename)
     constants = parse_workbook(sheet_filename)
     with open('codata_constants.json', 'w') as f:
-        json.dump(constants, f, indent=4)
+        json.dump(constants, f, cls=ExactDecimalEncoder, indent=4)
 
 if __name__ == '__main__':
     global args
@@ -0,0 +1,84 @@
+"""
+Loads and looks up the CODATA constants from the generated JSON file.
+
+This module only depends on the Python standard library so that scripts looking up constant
+values do not pay the import cost of the RDF (rdflib), Excel (openpyxl) or HTTP (requests) packages.
+"""
+
+from functools import lru_cache
+import json
+import os
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from numeric import ExactDecimal
+
+@lru_cache(maxsize=1)
+def get_codata_json() -> dict:
+    """Loads and returns the codata_constants.json file"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    json_path = os.path.join(current_dir, 'codata_constants.json')
+    with open(json_path, 'r') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=1)
+def get_quantities() -> dict:
+    """Returns a map of quantity identifiers to quantities"""
+    return {quantity['id']: quantity for quantity in get_codata_json().get('quantities', [])}
+
+@lru_cache(maxsize=1)
+def get_units() -> dict:
+    """Returns a map of unit identifiers to units"""
+    return {unit['id']: unit for unit in get_codata_json().get('units', [])}
+
+@lru_cache(maxsize=1)
+def get_constants() -> dict:
+    """Returns a map of constant identifiers to constants"""
+    constants = {}
+    for quantity in get_codata_json().get('quantities', []):
+        for constant in quantity.get('constants', []):
+            constants[constant['id']] = constant
+    return constants
+
+@lru_cache(maxsize=1)
+def get_nist_constants() -> dict:
+    """Returns a map of NIST identifiers to constants"""
+    constants = {}
+    for constant in get_constants().values():
+        nist_id = constant.get('ids', {}).get('NIST')
+        if nist_id:
+            constants[nist_id] = constant
+    return constants
+
+def get_constant(id: str) -> Optional[dict]:
+    """Lookup a constant by its identifier, or by its NIST identifier"""
+    return get_constants().get(id) or get_nist_constants().get(id)
+
+def get_constant_value(id: str, version: Optional[str] = None) -> Optional[dict]:
+    """Lookup the value of a constant for the given version, or the most recent one if not specified"""
+    constant = get_constant(id)
+    if not constant:
+        return None
+    values = constant.get('values', [])
+    if version is None:
+        return max(values, key=lambda value: value.get('version'), default=None)
+    for value in values:
+        if value.get('version') == str(version):
+            return value
+    return None
+
+def get_value_decimals(value: dict) -> Tuple[Optional['ExactDecimal'], Optional['ExactDecimal']]:
+    """Returns the canonical value and uncertainty (None if exact) of a constant value"""
+    from numeric import to_decimal # imported here to keep the lookups fast to import
+    return to_decimal(value.get('value')), to_decimal(value.get('uncertainty'))
+
+_dependent_caches = []
+
+def register_cache(function):
+    """Registers a cached function derived from the constants, to be cleared along with them"""
+    _dependent_caches.append(function)
+
+def clear_cache():
+    """Clears the loaded data so the next lookup reloads the JSON file"""
+    for function in (get_codata_json, get_quantities, get_units, get_constants, get_nist_constants, *_dependent_caches):
+        function.cache_clear()
@@ -0,0 +1,102 @@
+"""
+Converts values between the energy equivalent units using the CODATA relationship constants.
+
+The conversion factors of a version are the 56 "X - Y Relationship" constants (the NIST factors_{year}.pdf tables)
+between the joule (J), electronvolt (eV), hertz (Hz), kelvin (K), kilogram (kg), inverse meter (m-1),
+hartree (E_h), and atomic mass unit (u). They are loaded once per version in a NumPy matrix so that
+arrays of any size are converted in a single vectorized operation, along with their uncertainties.
+"""
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+import constants
+
+# unit identifier and name used in the relationship constants identifiers
+ENERGY_UNITS = {
+    "J": "Joule",
+    "eV": "ElectronVolt",
+    "Hz": "Hertz",
+    "K": "Kelvin",
+    "kg": "Kilogram",
+    "m-1": "InverseMeter",
+    "E_h": "Hartree",
+    "u": "AtomicMassUnit",
+}
+UNIT_INDEX = {unit: index for index, unit in enumerate(ENERGY_UNITS)}
+SORTED_UNITS = np.array(sorted(UNIT_INDEX))
+SORTED_UNIT_INDEXES = np.array([UNIT_INDEX[unit] for unit in SORTED_UNITS], dtype=np.intp)
+
+def get_latest_version() -> str:
+    """Returns the most recent version of the relationship constants"""
+    return constants.get_constant_value("JouleElectronVoltRelationship")['version']
+
+def get_unit_index(unit):
+    """Returns the matrix index of a unit, or an array of indexes for an array of units"""
+    if isinstance(unit, str):
+        if unit not in UNIT_INDEX:
+            raise ValueError(f"Unknown energy unit '{unit}', expected one of {list(ENERGY_UNITS)}")
+        return UNIT_INDEX[unit]
+    units = np.asarray(unit)
+    if units.dtype.kind in "iu":
+        if units.size and (units.min() < 0 or units.max() >= len(ENERGY_UNITS)):
+            raise ValueError(f"Energy unit indexes must be between 0 and {len(ENERGY_UNITS) - 1}")
+        return units
+    # vectorized lookup of the units in the sorted unit identifiers
+    positions = np.searchsorted(SORTED_UNITS, units).clip(0, len(SORTED_UNITS) - 1)
+    unknown = SORTED_UNITS[positions] != units
+    if unknown.any():
+        get_unit_index(str(units[unknown].flat[0]))  # raises for the first unknown unit
+    return SORTED_UNIT_INDEXES[positions]
+
+@lru_cache(maxsize=None)
+def get_conversion_matrix(version: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the conversion factors and their standard uncertainties for the given version (latest if not specified).
+
+    factors[i, j] is the value of 1 unit i expressed in unit j, following the ENERGY_UNITS order.
+    """
+    version = str(version) if version is not None else get_latest_version()
+    size = len(ENERGY_UNITS)
+    factors = np.eye(size)
+    uncertainties = np.zeros((size, size))
+    for i, (from_unit, from_name) in enumerate(ENERGY_UNITS.items()):
+        for j, (to_unit, to_name) in enumerate(ENERGY_UNITS.items()):
+            if i == j:
+                continue
+            id = f"{from_name}{to_name}Relationship"
+            value = constants.get_constant_value(id, version)
+            if value is None:
+                raise ValueError(f"Relationship constant {id} not found for version {version}")
+            factor, uncertainty = constants.get_value_decimals(value)
+            factors[i, j] = factor.value
+            if uncertainty is not None:
+                uncertainties[i, j] = uncertainty.value
+    factors.flags.writeable = False
+    uncertainties.flags.writeable = False
+    return factors, uncertainties
+
+# the matrices are rebuilt when the constants are reloaded
+constants.register_cache(get_conversion_matrix)
+
+def convert(values, from_unit, to_unit, uncertainties=None, version: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts values from one energy unit to another and returns the converted values and their uncertainties.
+
+    The units can be unit identifiers (e.g. 'eV') or arrays of identifiers or matrix indexes broadcasting
+    with the values, to convert each value between its own pair of units.
+    The uncertainties of the values (if any) and of the conversion factors are combined assuming no correlation.
+    """
+    factors, factor_uncertainties = get_conversion_matrix(str(version) if version is not None else None)
+    i = get_unit_index(from_unit)
+    j = get_unit_index(to_unit)
+    values = np.asarray(values, dtype=float)
+    factor = factors[i, j]
+    factor_uncertainty = factor_uncertainties[i, j]
+    converted = values * factor
+    if uncertainties is None:
+        converted_uncertainties = np.abs(values * factor_uncertainty)
+    else:
+        converted_uncertainties = np.hypot(np.asarray(uncertainties, dtype=float) * factor, values * factor_uncertainty)
+    return converted, converted_uncertainties
@@ -0,0 +1,69 @@
+"""
+Measures the import time of the utils modules.
+
+Each module is imported in a fresh interpreter using `python -X importtime` and the cumulative
+time is reported. Results can be appended to a JSON lines file to track them over time:
+the measurements are kept in import_times.jsonl (python import_times.py -o import_times.jsonl -l <revision>).
+The first entry was measured on the tree before the lazy imports (modules missing there are recorded as null).
+"""
+import argparse
+from datetime import datetime, timezone
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+
+MODULES = ["constants", "codata_constants", "package"]
+
+def measure_import_time(module: str) -> float:
+    """Returns the cumulative import time of a module in milliseconds"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=current_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise ImportError(lines[-1] if lines else f"import failed with return code {result.returncode}")
+    # last line is the top level module: "import time: self [us] | cumulative | imported package"
+    for line in reversed(result.stderr.splitlines()):
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1]) / 1000
+    raise ImportError(f"Import time not reported for {module}")
+
+def main():
+    record = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "import_ms": {}
+    }
+    if args.label:
+        record["label"] = args.label
+    for module in args.module or MODULES:
+        try:
+            elapsed = measure_import_time(module)
+            record["import_ms"][module] = elapsed
+            logging.info(f"{module}: {elapsed:.1f} ms")
+        except ImportError as e:
+            record["import_ms"][module] = None
+            logging.error(f"{module}: {e}")
+    if args.output:
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+        logging.info(f"Import times have been appended to {args.output}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the import time of the utils modules")
+    parser.add_argument("module", nargs="*", help="The module(s) to measure (default: all)")
+    parser.add_argument("-o","--output", help="JSON lines file to append the measurements to")
+    parser.add_argument("-l","--label", help="Label of the measured revision, recorded with the measurements")
+    parser.add_argument("-ll","--loglevel", help="Python logging level", default="INFO")
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s')
+    if args.loglevel:
+        logging.getLogger().setLevel(args.loglevel.upper())
+
+    main()
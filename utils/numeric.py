@@ -0,0 +1,111 @@
+"""
+Canonical numeric representation of the constants values and uncertainties.
+
+Values are published as strings (e.g. '6.644 657 3357 e-27', '1.054 571 817... e-34', '0.000 000 0020 e-27').
+They are parsed once into an ExactDecimal holding the integer mantissa, the power of ten of its last digit,
+the number of significant digits and the scientific exponent used for display, along with a cached float
+and clean string. Instances are interned so that identical values (e.g. exact constants repeated across
+versions) share the same object.
+
+The models (PhysicalConstant, codata_constants.parse_workbook) keep the ExactDecimal instances, and the
+writers format from them instead of re-parsing the strings. Exact arithmetic is available through decimal.Decimal.
+"""
+from functools import lru_cache
+import json
+from typing import Optional, Union
+
+class ExactDecimal:
+    """An exact decimal number: mantissa * 10**exponent, with digits significant digits"""
+    __slots__ = ('mantissa', 'exponent', 'digits', 'scientific_exponent', 'value', '_str')
+
+    def __init__(self, mantissa: int, exponent: int, digits: int, scientific_exponent: Optional[int] = None):
+        self.mantissa = mantissa
+        self.exponent = exponent
+        self.digits = digits
+        self.scientific_exponent = scientific_exponent
+        # correctly rounded float, computed once
+        self.value = float(f"{mantissa}e{exponent}")
+        self._str = None
+
+    def _key(self):
+        return (self.mantissa, self.exponent, self.digits, self.scientific_exponent)
+
+    def __eq__(self, other):
+        return isinstance(other, ExactDecimal) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"ExactDecimal({str(self)!r})"
+
+    def __float__(self) -> float:
+        return self.value
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = self.format(self.scientific_exponent)
+        return self._str
+
+    def to_decimal(self):
+        """Returns the exact value as a decimal.Decimal"""
+        from decimal import Decimal # imported here as only needed for exact arithmetic
+        return Decimal(f"{self.mantissa}e{self.exponent}")
+
+    def format(self, exponent: Optional[Union[int, str]] = None) -> str:
+        """
+        Returns the clean string of the number (no spaces), optionally scaled to the given scientific exponent.
+
+        The exponent is an int or a string such as '-27' or the NIST display exponent 'e-27' (PhysicalConstant.exponent).
+        For example 66446573357 * 10**-37 is '6.6446573357e-27' with exponent -27, and uncertainty 20 * 10**-37 is '0.0000000020e-27'.
+        """
+        if isinstance(exponent, str):
+            exponent = exponent.strip().lstrip('eE') or None
+        if exponent is not None:
+            exponent = int(exponent)
+        scale = self.exponent - (exponent or 0)
+        sign = '-' if self.mantissa < 0 else ''
+        digits = str(abs(self.mantissa))
+        if scale >= 0:
+            number = digits + '0' * scale
+        else:
+            digits = digits.rjust(-scale + 1, '0')
+            number = f"{digits[:scale]}.{digits[scale:]}"
+        if exponent is not None:
+            number += f"e{exponent}"
+        return sign + number
+
+class ExactDecimalEncoder(json.JSONEncoder):
+    """JSON encoder writing ExactDecimal instances as their clean string"""
+    def default(self, obj):
+        if isinstance(obj, ExactDecimal):
+            return str(obj)
+        return super().default(obj)
+
+@lru_cache(maxsize=None)
+def intern_decimal(mantissa: int, exponent: int, digits: int, scientific_exponent: Optional[int] = None) -> ExactDecimal:
+    """Returns the shared instance for the given number"""
+    return ExactDecimal(mantissa, exponent, digits, scientific_exponent)
+
+@lru_cache(maxsize=None)
+def parse_decimal(text: str) -> ExactDecimal:
+    """Parses a NIST or clean number string into its interned ExactDecimal"""
+    text = text.replace(' ', '').replace('...', '')
+    number, _, scientific_exponent = text.lower().partition('e')
+    integer_part, _, decimal_part = number.partition('.')
+    mantissa_str = (integer_part + decimal_part).lstrip('+')
+    mantissa = int(mantissa_str)
+    scientific_exponent = int(scientific_exponent) if scientific_exponent else None
+    exponent = (scientific_exponent or 0) - len(decimal_part)
+    digits = len(mantissa_str.lstrip('-').lstrip('0')) or 1
+    return intern_decimal(mantissa, exponent, digits, scientific_exponent)
+
+def to_decimal(value) -> Optional[ExactDecimal]:
+    """Converts a string or number (e.g. a spreadsheet cell value) to its interned ExactDecimal"""
+    if value is None:
+        return None
+    if isinstance(value, ExactDecimal):
+        return value
+    if isinstance(value, float):
+        value = repr(value)
+    return parse_decimal(str(value))
@@ -17,13 +17,13 @@ Package the CODATA constants data
 #
 
 import argparse
-from functools import lru_cache
-import json
 import logging
 import os
 from rdflib import XSD, Graph, Namespace, Literal, RDF, URIRef, SKOS, DCTERMS
 from urllib.parse import quote
 
+from constants import get_codata_json
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -36,15 +36,6 @@ SCHEMA = Namespace("https://schema.org/")
 QUDT = Namespace("http://qudt.org/vocab/quantitykind/")
 UCUM = Namespace("https://w3id.org/uom/")
 
-def get_codata_json() -> dict:
-    @lru_cache(maxsize=1)
-    def _load_codata_json():
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        json_path = os.path.join(current_dir, 'codata_constants.json')
-        with open(json_path, 'r') as f:
-            return json.load(f)
-    return _load_codata_json()
-
 def new_rdf_graph():
     g = Graph()
     g.bind("codata", MODEL)
@@ -62,22 +53,27 @@ def generate_rdf() -> Graph:
         g += generate_rdf_unit(unit_uriref, unit)
     # QUANTITIES
     for quantity in json_data.get("quantities", []):
-        quantity_uriref = URIRef(QUANTITY[quantity.get('id')])
-        g += generate_rdf_quantity(quantity_uriref, quantity)
-        # CONSTANTS
-        for constant in quantity.get("constants", []):
-            constant_uriref = URIRef(CONSTANT[constant.get('id')])
-            g.add((quantity_uriref, MODEL.hasConstant, constant_uriref))
-            g += generate_rdf_constant(constant_uriref, constant)
-            g.add((constant_uriref, SKOS.broader, quantity_uriref))
-            # VERSIONS/VALUES
-            for value in constant.get("values", []):
-                version = value.get('version')
-                value_uriref = URIRef(f"{constant_uriref}/{version}")
-                g += generate_rdf_constant_value(value_uriref, value)
-                g.add((constant_uriref, MODEL.hasValue, value_uriref))
-                g.add((value_uriref, DCTERMS.isVersionOf, constant_uriref))
+        g += generate_rdf_quantity_tree(quantity)
+    return g
 
+def generate_rdf_quantity_tree(quantity: dict) -> Graph:
+    """Generates the graph for a quantity, its constants, and their values"""
+    g = new_rdf_graph()
+    quantity_uriref = URIRef(QUANTITY[quantity.get('id')])
+    g += generate_rdf_quantity(quantity_uriref, quantity)
+    # CONSTANTS
+    for constant in quantity.get("constants", []):
+        constant_uriref = URIRef(CONSTANT[constant.get('id')])
+        g.add((quantity_uriref, MODEL.hasConstant, constant_uriref))
+        g += generate_rdf_constant(constant_uriref, constant)
+        g.add((constant_uriref, SKOS.broader, quantity_uriref))
+        # VERSIONS/VALUES
+        for value in constant.get("values", []):
+            version = value.get('version')
+            value_uriref = URIRef(f"{constant_uriref}/{version}")
+            g += generate_rdf_constant_value(value_uriref, value)
+            g.add((constant_uriref, MODEL.hasValue, value_uriref))
+            g.add((value_uriref, DCTERMS.isVersionOf, constant_uriref))
     return g
 
 def generate_rdf_quantity(quantity_uriref: URIRef, data: dict) -> Graph:
@@ -150,12 +146,13 @@ def generate_rdf_constant_value(value_uriref: URIRef, data: dict) -> Graph:
     g = new_rdf_graph()
     g.add((value_uriref, RDF.type, MODEL.ConstantValue))
     g.add((value_uriref, MODEL.version, Literal(version)))
+    # values are clean strings or ExactDecimal (resident model): both are written as their canonical string
     if data.get('value') is not None:
-        g.add((value_uriref, MODEL.value, Literal(data.get('value'), datatype=XSD.string))) # use string to prevent loss of precision
+        g.add((value_uriref, MODEL.value, Literal(str(data.get('value')), datatype=XSD.string))) # use string to prevent loss of precision
     else:
         logger.error(f"Constant value missing for {value_uriref} version {version}")
     if data.get('uncertainty') is not None:
-        g.add((value_uriref, MODEL.uncertainty, Literal(data.get('uncertainty'), datatype=XSD.string))) # use string to prevent loss of precision
+        g.add((value_uriref, MODEL.uncertainty, Literal(str(data.get('uncertainty')), datatype=XSD.string))) # use string to prevent loss of precision
     if data.get('exponent') is not None:
         g.add((value_uriref, MODEL.exponent, Literal(data.get('exponent'), datatype=XSD.integer)))
     if data.get('is_exact') is not None:
@@ -0,0 +1,166 @@
+"""
+Watches the curation input files and incrementally rebuilds the outputs.
+
+The parsed model, the NIST identifier registry and the serialized RDF shards are kept in memory between changes:
+- codata_constants.xlsx: the workbook is parsed again, codata_constants.json is rewritten, and only the
+  RDF shards (units, quantity trees) whose content changed are regenerated and serialized. The turtle file
+  is written from the serialized shards (a Turtle document can repeat its @prefix declarations)
+- nist/{year}/allascii_{year}.txt: only the changed year is repackaged (JSON and CSV)
+- nist/nist_ids.json: the identifier registry is reloaded and all years are repackaged
+
+Files are polled for modification, so no additional package is required.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+import constants
+from codata_constants import parse_workbook
+from numeric import ExactDecimalEncoder
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+nist_dir = os.path.join(os.path.dirname(current_dir), 'nist')
+sys.path.append(nist_dir)
+import repackage  # noqa: E402
+
+class ResidentModel:
+    """Holds the parsed model and its serialized RDF shards between rebuilds"""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.model = None
+        self.shards = {} # maps ('unit'|'quantity', id) to (source entry, turtle)
+
+    def update_model(self, workbook_filename: str):
+        """Parses the workbook and rewrites the outputs affected by the changes"""
+        model = parse_workbook(workbook_filename)
+        if model == self.model:
+            logging.info("No changes in the model")
+            return
+        self.model = model
+        with open(os.path.join(current_dir, 'codata_constants.json'), 'w') as f:
+            json.dump(model, f, cls=ExactDecimalEncoder, indent=4)
+        constants.clear_cache()
+        logging.info("codata_constants.json has been updated")
+        self.update_graph()
+
+    def update_graph(self):
+        """Regenerates the RDF shards that changed and writes the turtle file"""
+        import package # imported here as rdflib is only needed when generating RDF
+        entries = {}
+        for unit in self.model.get('units', []):
+            entries[('unit', unit.get('id'))] = unit
+        for quantity in self.model.get('quantities', []):
+            entries[('quantity', quantity.get('id'))] = quantity
+        changed = 0
+        # remove dropped or modified shards
+        for key in list(self.shards):
+            entry, _ = self.shards[key]
+            if entries.get(key) != entry:
+                del self.shards[key]
+                changed += 1
+        # add new or modified shards
+        for key, entry in entries.items():
+            if key in self.shards:
+                continue
+            kind, id = key
+            if kind == 'unit':
+                shard = package.generate_rdf_unit(package.URIRef(package.UNIT[id]), entry)
+            else:
+                shard = package.generate_rdf_quantity_tree(entry)
+            self.shards[key] = (entry, shard.serialize(format="turtle"))
+            changed += 1
+        logging.info(f"{changed} RDF shard(s) regenerated")
+        os.makedirs(self.output_dir, exist_ok=True)
+        ttl_filepath = os.path.join(self.output_dir, "codata_constants.ttl")
+        with open(ttl_filepath, 'w', encoding='utf-8') as f:
+            for key in entries:
+                f.write(self.shards[key][1])
+        logging.info(f"{ttl_filepath} has been updated")
+
+def reload_nist_ids():
+    """Clears the cached NIST identifier registry"""
+    for function in (repackage.get_nist_ids, repackage.get_nist_names, repackage.lookup_id):
+        function.cache_clear()
+
+def get_watched_files(years) -> dict:
+    """Returns a map of watched file paths to their rebuild key"""
+    files = {
+        os.path.join(current_dir, 'codata_constants.xlsx'): 'workbook',
+        os.path.join(nist_dir, 'nist_ids.json'): 'nist_ids',
+    }
+    for year in years:
+        files[os.path.join(nist_dir, str(year), f'allascii_{year}.txt')] = year
+    return files
+
+def get_mtime(filepath):
+    try:
+        return os.stat(filepath).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def rebuild(resident: ResidentModel, key, years):
+    if key == 'workbook':
+        resident.update_model(os.path.join(current_dir, 'codata_constants.xlsx'))
+    elif key == 'nist_ids':
+        reload_nist_ids()
+        for year in years:
+            repackage.process_year(year)
+    else:
+        repackage.process_year(key)
+
+def main():
+    years = args.year or repackage.ALL_VERSIONS
+    resident = ResidentModel(args.output_dir)
+    files = get_watched_files(years)
+    mtimes = {filepath: get_mtime(filepath) for filepath in files}
+
+    # initial build: load the model and RDF shards in memory
+    start = time.perf_counter()
+    resident.update_model(os.path.join(current_dir, 'codata_constants.xlsx'))
+    logging.info(f"Initial build completed in {time.perf_counter() - start:.2f}s, watching {len(files)} files")
+
+    while True:
+        time.sleep(args.interval)
+        for filepath, key in files.items():
+            mtime = get_mtime(filepath)
+            if mtime == mtimes[filepath]:
+                continue
+            if mtime is None:
+                logging.warning(f"{filepath} has been removed")
+                mtimes[filepath] = mtime
+                continue
+            logging.info(f"{filepath} has changed")
+            start = time.perf_counter()
+            # retried only once the file changes again (e.g. a half-saved file is saved again)
+            mtimes[filepath] = mtime
+            try:
+                rebuild(resident, key, years)
+            except Exception:
+                logging.exception(f"Rebuild failed for {filepath}, waiting for the next change")
+                continue
+            logging.info(f"Rebuild completed in {time.perf_counter() - start:.2f}s")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Watch the input files and incrementally rebuild the outputs")
+    parser.add_argument('year', nargs='*', type=int, help='The NIST year(s) to watch (default: all)')
+    parser.add_argument(
+        "-o", "--output-dir",
+        default=os.path.join(os.path.dirname(current_dir), "dist"),
+        help="Output directory for generated files"
+    )
+    parser.add_argument("-i", "--interval", type=float, help="Polling interval in seconds", default=0.5)
+    parser.add_argument("-ll","--loglevel", help="Python logging level", default="INFO")
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s')
+    if args.loglevel:
+        logging.getLogger().setLevel(args.loglevel.upper())
+
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass